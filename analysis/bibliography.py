@@ -1,22 +1,56 @@
+from __future__ import annotations
+
 import argparse
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import itertools
 import logging
+import os
 import pathlib
+import pickle
+import re
+import shutil
+import subprocess
 import sys
-from typing import List, Optional
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+# Third-party modules (litstudy, matplotlib, scikit-learn, ...) take seconds to import,
+# so they are imported inside the functions that use them. This keeps ``--help`` and
+# the import of this module fast.
+if TYPE_CHECKING:
+    import litstudy
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    import pandas as pd
+    from litstudy.nlp import TopicModel
+    from scipy import sparse
 
-import litstudy
-import matplotlib.pyplot as plt
-import networkx as nx
-import seaborn as sbs
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
 
 # --- Configuration Constants ---
 FIG_SIZE = (12, 8)
 PLOT_LIMIT_BARS = 15
 MAX_NETWORK_EDGES = 500
 NUM_TOPICS = 10
-NMF_MAX_ITER = 250
+NMF_MAX_ITER = 100
+NMF_BATCH_SIZE = 512
+NMF_TOL = 1e-4
+NMF_MAX_NO_IMPROVEMENT = 10
+NMF_CACHE_FILE = "nmf_model.joblib"
+CACHE_DIR = ".cache"
+SCOPUS_CACHE_FILE = ".scopus_cache.pkl"
+NETWORK_CACHE_FILE = "cocitation_network.pkl"
 DPI_SAVING = 300
+PNG_SAVE_KWARGS = {"pil_kwargs": {"optimize": True, "compress_level": 9}}
+OPTIMIZE_PNG_CMD = shutil.which("oxipng")
 DEFAULT_TOPIC = "travel"
+TOPIC_THRESHOLD = 0.2
 
 # Configure logging
 logging.basicConfig(
@@ -35,7 +69,7 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
 
     Returns:
         argparse.Namespace: Parsed command-line arguments with attributes for
-            data_dir, save_plots, output_dir, and topic_keyword.
+            data_dir, save_plots, output_dir, cache_dir, and topic_keyword.
     """
     parser = argparse.ArgumentParser(
         description="Perform automated literature analysis using litstudy.",
@@ -55,6 +89,12 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--output-dir", type=str, default="results", help="Directory to save results and plots."
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=CACHE_DIR,
+        help="Directory for cached intermediate results (Scopus records, networks, models).",
+    )
     parser.add_argument(
         "--topic-keyword",
         type=str,
@@ -64,32 +104,304 @@ def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
-def setup_plotting_style():
-    """Configures global plotting styles."""
-    plt.rcParams["figure.figsize"] = FIG_SIZE
-    sbs.set_theme(context="paper", style="whitegrid")
+@functools.lru_cache(maxsize=None)
+def _plotting_rc() -> dict:
+    """Returns the rcParams of the plotting style (seaborn's paper/whitegrid theme)."""
+    import matplotlib.pyplot as plt
+    import seaborn as sbs
+
+    return {
+        **sbs.axes_style("whitegrid"),
+        **sbs.plotting_context("paper"),
+        "axes.prop_cycle": plt.cycler(color=sbs.color_palette("deep")),
+        "figure.figsize": FIG_SIZE,
+        "savefig.dpi": DPI_SAVING,
+        "savefig.bbox": "tight",
+    }
+
+
+@contextlib.contextmanager
+def plotting_style():
+    """
+    Applies the plotting style to the figures created inside the block.
+
+    Unlike ``sbs.set_theme``, the global ``rcParams`` are only changed for the
+    duration of the block. Can also be used as a function decorator.
+    """
+    import matplotlib.pyplot as plt
+
+    with plt.rc_context(_plotting_rc()):
+        yield
 
 
-def save_or_show_plot(save: bool, filename: str, output_dir: pathlib.Path):
+def save_or_show_plot(
+    save: bool, filename: str, output_dir: pathlib.Path, fig: Optional[plt.Figure] = None
+):
     """
-    Helper to save or show the current plot.
+    Helper to save or show a plot.
+
+    The figure is closed afterwards so pyplot does not keep every figure of the
+    run alive. PNGs are written with maximum zlib compression and, if ``oxipng``
+    is on the PATH, optimized further in place. Resolution and bounding box are
+    taken from the active ``plotting_style``.
 
     Args:
         save: If True, save to file. If False, show interactive window.
         filename: Name of the file to save (e.g. 'plot.png').
         output_dir: Path to the output directory.
+        fig: Figure to save or show. Defaults to the current figure.
     """
+    import matplotlib.pyplot as plt
+
+    fig = fig or plt.gcf()
+
     if save:
         output_path = output_dir / filename
         try:
-            plt.savefig(output_path, dpi=DPI_SAVING, bbox_inches="tight")
+            is_png = output_path.suffix.lower() == ".png"
+            extra = PNG_SAVE_KWARGS if is_png else {}
+            fig.savefig(output_path, **extra)
+            if is_png and OPTIMIZE_PNG_CMD:
+                subprocess.run([OPTIMIZE_PNG_CMD, "-o", "4", "-q", str(output_path)], check=False)
             logger.info(f"Saved plot: {filename}")
         except Exception as e:
             logger.error(f"Failed to save plot {filename}: {e}")
         finally:
-            plt.close()
+            plt.close(fig)
     else:
         plt.show()
+        plt.close(fig)
+
+
+_BIB_ENTRY_RE = re.compile(r"\s*@\s*(\w+)\s*([{(])")
+_BIB_KEY_RE = re.compile(r"\s*([^,\s{}()]*)\s*,?")
+_BIB_FIELD_RE = re.compile(r"[\s,]*([^\s=,{}()\"#]+)\s*=\s*")
+_BIB_BARE_RE = re.compile(r"[^\s,#{}()\"]+")
+_BIB_BRACES_RE = re.compile(r"[{}]")
+_BIB_QUOTED_RE = re.compile(r'[{}"]')
+_BIB_PARENS_RE = re.compile(r"[{})]")
+_BIB_NEXT_LINE_AT_RE = re.compile(r"\n\s*@")
+_BIB_MONTHS = {
+    m[:3].lower(): m
+    for m in [
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December",
+    ]  # fmt: skip
+}
+
+
+def _bib_delimited(text: str, start: int, pattern: re.Pattern, closing: str):
+    """Returns ``(content, end)`` of a value opened at ``text[start]``.
+
+    The delimiters are located with a regex instead of walking characters one by
+    one; ``closing`` is the character that ends the value at brace depth zero.
+    """
+    depth = 0  # Nesting level of braces inside the value
+    for m in pattern.finditer(text, start + 1):
+        c = m.group()
+        if c == closing and depth == 0:
+            return text[start + 1 : m.start()], m.end()
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+    raise ValueError(f"Unbalanced delimiters at offset {start}")
+
+
+def _bib_strip_lines(value: str) -> str:
+    """Strips the indentation of continuation lines, like bibtexparser v1."""
+    lines = value.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return "\n".join(lines)
+
+
+def _bib_value(text: str, pos: int, strings: dict):
+    """Parses a (possibly ``#``-concatenated) field value starting at ``pos``."""
+    parts = []
+    while True:
+        while text[pos].isspace():
+            pos += 1
+
+        if text[pos] == "{":
+            part, pos = _bib_delimited(text, pos, _BIB_BRACES_RE, "}")
+            part = _bib_strip_lines(part)
+        elif text[pos] == '"':
+            part, pos = _bib_delimited(text, pos, _BIB_QUOTED_RE, '"')
+            part = _bib_strip_lines(part)
+        else:
+            m = _BIB_BARE_RE.match(text, pos)
+            if not m:
+                raise ValueError(f"Expected a value at offset {pos}")
+            part, pos = strings.get(m.group().lower(), m.group()), m.end()
+        parts.append(part)
+
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text) or text[pos] != "#":
+            return "".join(parts), pos
+        pos += 1
+
+
+def parse_bibtex(text: str) -> List[dict]:
+    """
+    Parses BibTeX source into entry dicts shaped like ``bibtexparser`` v1 output.
+
+    Field names are lowercased, the citation key is stored under ``ID`` and the
+    entry type under ``ENTRYTYPE``. ``@string`` macros (and the common month
+    abbreviations) are expanded; ``@comment`` and ``@preamble`` blocks are skipped.
+    As in bibtexparser, the indentation of continuation lines in multi-line values
+    is removed, duplicate fields keep their first value, and a ``@comment`` runs
+    until the next line starting with ``@``. Text between entries (such as ``%``
+    comment lines, including commented-out entries) is skipped the same way.
+    """
+    strings = dict(_BIB_MONTHS)
+    entries = []
+    pos = 0
+
+    while pos < len(text):
+        m = _BIB_ENTRY_RE.match(text, pos)
+        if not m:
+            # Not an entry: skip to the next line that starts with "@"
+            end = _BIB_NEXT_LINE_AT_RE.search(text, pos)
+            if not end:
+                break
+            pos = end.end() - 1
+            continue
+
+        kind, opening = m.group(1).lower(), m.group(2)
+        closing = "}" if opening == "{" else ")"
+        pos = m.end()
+
+        if kind == "comment":
+            end = _BIB_NEXT_LINE_AT_RE.search(text, pos)
+            pos = end.start() if end else len(text)
+            continue
+        if kind == "preamble":
+            pattern = _BIB_BRACES_RE if opening == "{" else _BIB_PARENS_RE
+            _, pos = _bib_delimited(text, m.end() - 1, pattern, closing)
+            continue
+
+        entry = {}
+        if kind != "string":
+            key = _BIB_KEY_RE.match(text, pos)
+            entry.update(ENTRYTYPE=kind, ID=key.group(1))
+            pos = key.end()
+
+        while field := _BIB_FIELD_RE.match(text, pos):
+            value, pos = _bib_value(text, field.end(), strings)
+            entry.setdefault(field.group(1).lower(), value)
+
+        pos = text.index(closing, pos) + 1
+        if kind == "string":
+            strings.update((k.lower(), v) for k, v in entry.items())
+        else:
+            entries.append(entry)
+
+    return entries
+
+
+def load_bibtex_fast(path: str) -> litstudy.DocumentSet:
+    """
+    Loads a BibTeX file like ``litstudy.load_bibtex``, but much faster.
+
+    ``litstudy.load_bibtex`` uses bibtexparser v1, whose pyparsing grammar
+    dominates load time on large files. Here the file is split with
+    ``parse_bibtex`` and the entries are passed to litstudy's own ``BibDocument``.
+    Falls back to ``litstudy.load_bibtex`` if the file cannot be parsed.
+    """
+    import litstudy
+    from bibtexparser.latexenc import latex_to_unicode
+    from litstudy.common import robust_open
+    from litstudy.sources.bibtex import BibDocument
+
+    try:
+        with robust_open(path) as f:
+            entries = parse_bibtex(f.read())
+    except Exception as e:
+        logger.warning(f"Fast BibTeX parsing failed ({e}); using litstudy.load_bibtex")
+        return litstudy.load_bibtex(path)
+
+    def decode(value: str) -> str:
+        try:
+            return latex_to_unicode(value)
+        except Exception:
+            return value
+
+    docs = [
+        BibDocument({k: decode(v) for k, v in entry.items()})
+        for entry in entries
+        if entry.get("title")
+    ]
+    return litstudy.DocumentSet(docs)
+
+
+class _CsvRow(Mapping):
+    """Read-only dict-like view of one row of a column-oriented CSV table."""
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: dict, index: int):
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._columns[key][self._index]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+def load_csv_fast(path: str, document_cls, fallback) -> litstudy.DocumentSet:
+    """
+    Loads a CSV export with pandas' pyarrow engine.
+
+    The litstudy CSV loaders build one dict per row with ``csv.DictReader``. Here
+    the file is read column-wise by pyarrow and every document gets a lightweight
+    ``_CsvRow`` view on the shared columns instead, which roughly halves load time
+    and peak memory. Without pyarrow, or if the file cannot be read, ``fallback``
+    (the matching litstudy loader) is used.
+
+    Args:
+        path: Path to the CSV file.
+        document_cls: litstudy document class wrapping a row (e.g. ``IEEEDocument``).
+        fallback: litstudy loader to use instead (e.g. ``litstudy.load_ieee_csv``).
+    """
+    import litstudy
+    import pandas as pd
+
+    if not HAS_PYARROW:
+        return fallback(path)
+
+    try:
+        df = pd.read_csv(
+            path, engine="pyarrow", dtype_backend="pyarrow", dtype=str, keep_default_na=False
+        )
+    except Exception as e:
+        logger.warning(f"Fast CSV loading failed for {path} ({e}); using litstudy loader")
+        return fallback(path)
+
+    columns = {c: df[c].tolist() for c in df.columns}
+    return litstudy.DocumentSet(document_cls(_CsvRow(columns, i)) for i in range(len(df)))
+
+
+def load_ieee_csv_fast(path: str) -> litstudy.DocumentSet:
+    """Loads an IEEE Xplore CSV export with ``load_csv_fast``."""
+    import litstudy
+    from litstudy.sources.ieee import IEEEDocument
+
+    return load_csv_fast(path, document_cls=IEEEDocument, fallback=litstudy.load_ieee_csv)
+
+
+def load_springer_csv_fast(path: str) -> litstudy.DocumentSet:
+    """Loads a SpringerLink CSV export with ``load_csv_fast``."""
+    import litstudy
+    from litstudy.sources.springer import SpringerDocument
+
+    return load_csv_fast(path, document_cls=SpringerDocument, fallback=litstudy.load_springer_csv)
 
 
 def _load_single_source(
@@ -113,73 +425,228 @@ def _load_single_source(
         return None
 
 
+def merge_document_sets(docs_list: List[litstudy.DocumentSet]) -> litstudy.DocumentSet:
+    """
+    Merges several DocumentSets in a single pass.
+
+    Chaining ``DocumentSet.__or__`` compares every document against every other one
+    and rebuilds the set on each call. Instead, documents are concatenated once and
+    duplicates are dropped using hashed DOIs and canonical titles (the key used by
+    litstudy's fuzzy title match, so case, punctuation and BibTeX braces are
+    ignored). Two documents with different DOIs are never merged, even if their
+    titles match. The first occurrence of a document wins.
+
+    Args:
+        docs_list: Document sets to merge, in order of priority.
+
+    Returns:
+        litstudy.DocumentSet: The merged, deduplicated set.
+    """
+    import litstudy
+    import pandas as pd
+    from litstudy.common import canonical
+
+    docs = list(itertools.chain.from_iterable(d.docs for d in docs_list))
+    data = pd.concat([d.data for d in docs_list], ignore_index=True)
+
+    seen_dois = set()
+    seen_titles = {}  # canonical title -> DOI of the first document with that title (or None)
+    indices = []
+
+    for i, doc in enumerate(docs):
+        doi = (doc.id.doi or "").lower() or None
+        title = canonical(doc.id.title) if doc.id.title else None
+
+        if doi and doi in seen_dois:
+            continue
+        if title in seen_titles and not (doi and seen_titles[title]):
+            continue
+
+        if doi:
+            seen_dois.add(doi)
+        if title:  # canonical() is empty for titles made of stopwords only
+            seen_titles.setdefault(title, doi)
+        indices.append(i)
+
+    data = data.iloc[indices].reset_index(drop=True)
+    return litstudy.DocumentSet([docs[i] for i in indices], data)
+
+
 def load_data(data_dir: pathlib.Path) -> litstudy.DocumentSet:
     """
     Loads and merges bibliographic data from supported sources.
     Returns a unified DocumentSet. Exits if no data is found.
     """
-    docs_list = []
-
-    # Load sources safely
-    if d := _load_single_source(litstudy.load_ieee_csv, data_dir / "ieee.csv", "IEEE"):
-        docs_list.append(d)
-
-    if d := _load_single_source(litstudy.load_springer_csv, data_dir / "springer.csv", "Springer"):
-        docs_list.append(d)
+    sources = [
+        (load_ieee_csv_fast, data_dir / "ieee.csv", "IEEE"),
+        (load_springer_csv_fast, data_dir / "springer.csv", "Springer"),
+        (load_bibtex_fast, data_dir / "zotero.bib", "BibTeX/Zotero"),
+    ]
 
-    if d := _load_single_source(litstudy.load_bibtex, data_dir / "zotero.bib", "BibTeX/Zotero"):
-        docs_list.append(d)
+    # Load sources safely and concurrently; map() keeps the source order
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        results = executor.map(lambda source: _load_single_source(*source), sources)
+        docs_list = [d for d in results if d is not None]
 
     if not docs_list:
         logger.critical("No valid data loaded. Please check your data directory.")
         sys.exit(1)
 
     # Merge all sets
-    docs_all = docs_list[0]
-    for d in docs_list[1:]:
-        docs_all = docs_all | d
+    docs_all = merge_document_sets(docs_list)
 
     logger.info(f"Total merged corpus size: {len(docs_all)} papers")
     return docs_all
 
 
+@functools.lru_cache(maxsize=8)
+def _load_exclusions(path: str, mtime: float) -> Tuple[int, frozenset, dict]:
+    """
+    Loads an exclusion RIS file into hashed lookup tables.
+
+    The result is cached per path and modification time, so calling ``filter_data``
+    repeatedly does not re-read the file.
+
+    Returns:
+        Tuple[int, frozenset, dict]: The number of entries, their lowercased DOIs,
+        and a map from canonical title to the DOI of the first entry with that
+        title (or None).
+    """
+    import litstudy
+    from litstudy.common import canonical
+
+    docs_exclude = litstudy.load_ris_file(path)
+    dois = frozenset(d.id.doi.lower() for d in docs_exclude if d.id.doi)
+    titles = {}
+    for d in docs_exclude:
+        if d.id.title:
+            titles.setdefault(canonical(d.id.title), (d.id.doi or "").lower() or None)
+    return len(docs_exclude), dois, titles
+
+
 def filter_data(docs: litstudy.DocumentSet, data_dir: pathlib.Path) -> litstudy.DocumentSet:
-    """Filters data based on exclusion criteria (RIS file)."""
+    """
+    Filters data based on exclusion criteria (RIS file).
+
+    ``DocumentSet.__sub__`` compares every document against every excluded one.
+    Instead, documents are looked up by DOI and by canonical title (the key used by
+    litstudy's fuzzy title match) in hashed tables. A title match is ignored when
+    both documents have different DOIs.
+    """
+    from litstudy.common import canonical
+
     exclude_path = data_dir / "exclude.ris"
 
     if not exclude_path.exists():
         return docs
 
     try:
-        docs_exclude = litstudy.load_ris_file(str(exclude_path))
-        if docs_exclude:
-            original_count = len(docs)
-            docs = docs - docs_exclude
-            logger.info(f"Excluded {len(docs_exclude)} papers. Remaining: {len(docs)}")
+        num_excluded, dois, titles = _load_exclusions(
+            str(exclude_path), exclude_path.stat().st_mtime
+        )
+
+        def is_kept(doc) -> bool:
+            doi = (doc.id.doi or "").lower() or None
+            if doi in dois:
+                return False
+            title = canonical(doc.id.title) if doc.id.title else None
+            return title not in titles or bool(doi and titles[title])
+
+        if num_excluded:
+            docs = docs.filter_docs(is_kept)
+            logger.info(f"Excluded {num_excluded} papers. Remaining: {len(docs)}")
     except Exception as e:
         logger.warning(f"Failed to process exclusion file: {e}")
 
     return docs
 
 
-def refine_with_scopus(docs: litstudy.DocumentSet) -> litstudy.DocumentSet:
+def _doc_key(doc) -> str:
+    """Returns a stable identifier for a document (DOI, else lowercased title)."""
+    return doc.id.doi or (doc.title or "").lower()
+
+
+def _load_pickle(cache_path: Optional[pathlib.Path], default=None):
+    """Reads a pickled cache file, returning ``default`` if it is missing or unreadable."""
+    if not cache_path or not cache_path.exists():
+        return default
+
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+        return default
+
+
+def _save_pickle(obj, cache_path: pathlib.Path):
+    """Atomically writes a pickled cache file so an interrupted run cannot corrupt it."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, delete=False) as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_path)
+    except Exception as e:
+        logger.warning(f"Failed to write cache {cache_path}: {e}")
+
+
+def refine_with_scopus(
+    docs: litstudy.DocumentSet, cache_dir: Optional[pathlib.Path] = None
+) -> litstudy.DocumentSet:
     """
     attempts to refine data using Scopus API.
     Gracefully degrades if API key is missing.
+
+    If ``cache_dir`` is given, documents found on Scopus are stored in
+    ``cache_dir/.scopus_cache.pkl`` and only documents not yet in the cache are
+    sent to the API. Misses are not cached: ``refine_scopus`` also reports API
+    errors (quota, network, missing key) as "not found", so they are retried on
+    the next run.
     """
+    import litstudy
+
     # Suppress internal litstudy logs for cleaner output
     logging.getLogger("litstudy").setLevel(logging.CRITICAL)
 
+    cache_path = cache_dir / SCOPUS_CACHE_FILE if cache_dir else None
+    cache = _load_pickle(cache_path, default={})
+    keys = [_doc_key(d) for d in docs]
+    # Older caches also stored misses as None; those are retried
+    refined = {i: cache[key] for i, key in enumerate(keys) if cache.get(key) is not None}
+    missing = [i for i in range(len(docs)) if i not in refined]
+
     try:
-        logger.info("Refining metadata via Scopus (this may take a moment)...")
-        docs_scopus, docs_notfound = litstudy.refine_scopus(docs)
+        if missing:
+            logger.info(
+                f"Refining metadata via Scopus for {len(missing)} papers "
+                f"({len(docs) - len(missing)} cached, this may take a moment)..."
+            )
+            docs_scopus, docs_notfound = litstudy.refine_scopus(docs.select(missing))
+
+            # refine_scopus preserves the input order within both result sets and returns
+            # the original objects for misses, so results are matched back by position
+            found = iter(docs_scopus.docs)
+            notfound = iter(docs_notfound.docs)
+            next_notfound = next(notfound, None)
+            for i in missing:
+                if docs[i] is next_notfound:
+                    next_notfound = next(notfound, None)
+                else:
+                    refined[i] = next(found)
+
+            if cache_path:
+                cache.update((keys[i], doc) for i, doc in refined.items())
+                _save_pickle(cache, cache_path)
+        else:
+            logger.info("Using cached Scopus metadata for all papers.")
 
-        found_count = len(docs_scopus)
-        # Filter None types if any
-        docs_final = docs_scopus.filter_docs(lambda d: d is not None)
+        indices = [i for i in range(len(docs)) if i in refined]
+        data = docs.data.iloc[indices].reset_index(drop=True)
+        docs_final = litstudy.DocumentSet([refined[i] for i in indices], data)
 
         logger.info(
-            f"Scopus refinement results: {len(docs_final)} found, {len(docs_notfound)} not found."
+            f"Scopus refinement results: {len(docs_final)} found, "
+            f"{len(docs) - len(docs_final)} not found."
         )
         return docs_final
 
@@ -189,89 +656,519 @@ def refine_with_scopus(docs: litstudy.DocumentSet) -> litstudy.DocumentSet:
         return docs
 
 
+def _corpus_fingerprint(docs: litstudy.DocumentSet, corpus) -> str:
+    """Hashes the corpus vocabulary, document identifiers and word counts into a cache key."""
+    h = hashlib.sha1()
+    for token, index in sorted(corpus.dictionary.token2id.items()):
+        h.update(f"{token}:{index};".encode())
+    for doc, vector in zip(docs, corpus.frequencies):
+        h.update(f"{_doc_key(doc)}:{vector};".encode())
+    return h.hexdigest()
+
+
+def _corpus_matrix(corpus) -> sparse.csr_matrix:
+    """
+    Returns the TF-IDF weighted corpus as a sparse ``documents x tokens`` CSR matrix.
+
+    The matrix is built as float32: the NMF solvers are memory-bound, and single
+    precision halves the data streamed per iteration.
+    """
+    from gensim.matutils import corpus2csc
+    from gensim.models.tfidfmodel import TfidfModel
+
+    dic = corpus.dictionary
+    vectors = TfidfModel(dictionary=dic)[corpus.frequencies]
+    return corpus2csc(vectors, num_terms=len(dic), dtype="float32").T.tocsr()
+
+
+def train_nmf(
+    docs: litstudy.DocumentSet,
+    corpus,
+    num_topics: int,
+    cache_dir: Optional[pathlib.Path] = None,
+    minibatch: bool = True,
+) -> TopicModel:
+    """
+    Trains an NMF topic model with scikit-learn's MiniBatchNMF or NMF.
+
+    The TF-IDF weighted corpus is fed to the solver as a sparse float32 CSR matrix and the
+    factors are normalized the same way as ``litstudy.train_nmf_model``, so the
+    returned ``TopicModel`` can be used with all litstudy plotting functions.
+
+    Both solvers are warm-started from an NNDSVDA decomposition, which converges in
+    far fewer iterations than the random initialization used by gensim. Training
+    stops early once the reconstruction error stops improving.
+
+    Args:
+        docs: Documents the corpus was built from (used for the cache key).
+        corpus: Corpus returned by ``litstudy.build_corpus``.
+        num_topics: Number of topics to extract.
+        cache_dir: If given, the fitted factors are cached in this directory and
+            reused as long as the vocabulary, documents, their word counts and the
+            hyperparameters are unchanged.
+        minibatch: Use ``MiniBatchNMF`` if True, else the full-batch coordinate
+            descent ``NMF`` solver.
+
+    Returns:
+        TopicModel: The trained topic model.
+    """
+    import joblib
+    import numpy as np
+    from litstudy.nlp import TopicModel
+    from sklearn.decomposition import NMF, MiniBatchNMF
+
+    dic = corpus.dictionary
+    cache_path = cache_dir / NMF_CACHE_FILE if cache_dir else None
+    solver = "minibatch" if minibatch else "cd"
+    hyperparameters = f"{NMF_MAX_ITER}-{NMF_TOL}-{NMF_BATCH_SIZE}-{NMF_MAX_NO_IMPROVEMENT}"
+    key = f"{_corpus_fingerprint(docs, corpus)}-{num_topics}-{solver}-{hyperparameters}"
+
+    if cache_path and cache_path.exists():
+        try:
+            cached = joblib.load(cache_path)
+            if cached.get("key") == key:
+                logger.info(f"Loaded cached NMF model from {cache_path}")
+                return TopicModel(dic, cached["doc2topic"], cached["topic2token"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable NMF cache {cache_path}: {e}")
+
+    matrix = _corpus_matrix(corpus)
+
+    params = dict(
+        n_components=num_topics,
+        init="nndsvda",
+        beta_loss="frobenius",
+        max_iter=NMF_MAX_ITER,
+        tol=NMF_TOL,
+        random_state=0,
+    )
+    if minibatch:
+        model = MiniBatchNMF(
+            batch_size=NMF_BATCH_SIZE, max_no_improvement=NMF_MAX_NO_IMPROVEMENT, **params
+        )
+    else:
+        model = NMF(solver="cd", **params)
+    doc2topic = model.fit_transform(matrix)
+    topic2token = model.components_
+
+    # Rows sum to one, matching the gensim model used by litstudy
+    doc2topic /= np.maximum(doc2topic.sum(axis=1, keepdims=True), np.finfo(float).eps)
+    topic2token /= np.maximum(topic2token.sum(axis=1, keepdims=True), np.finfo(float).eps)
+
+    if cache_path:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            joblib.dump(
+                {"key": key, "doc2topic": doc2topic, "topic2token": topic2token}, cache_path
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache NMF model to {cache_path}: {e}")
+
+    return TopicModel(dic, doc2topic, topic2token)
+
+
+def cache_topic_lookups(topic_model: TopicModel, maxsize: int = 512) -> TopicModel:
+    """
+    Memoizes the token lookup of a trained topic model.
+
+    ``best_topic_for_token`` scans the model's topic-word matrix on every call.
+    It does not change after training, so the bound method is wrapped in
+    ``functools.lru_cache`` on the instance.
+
+    Returns:
+        TopicModel: The same model, for chaining.
+    """
+    topic_model.best_topic_for_token = functools.lru_cache(maxsize=maxsize)(
+        topic_model.best_topic_for_token
+    )
+    return topic_model
+
+
+def _affiliation_names(doc) -> set:
+    """Returns the distinct affiliation names of a document's authors."""
+    return {aff.name for a in doc.authors or [] for aff in a.affiliations or [] if aff.name}
+
+
+def _countries(doc) -> set:
+    """Returns the distinct affiliation countries of a document's authors."""
+    import litstudy
+
+    affiliations = (aff for a in doc.authors or [] for aff in a.affiliations or [])
+    return {c for c in map(litstudy.stats.extract_country, affiliations) if c}
+
+
+def _bar_plot(heights: pd.Series, title: str, ylabel: str = "No. of documents"):
+    """Draws pre-aggregated bar heights (index = labels) on a new figure."""
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    ax.bar(heights.index.astype(str), heights.to_numpy())
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis="x", rotation=45)
+    return fig
+
+
+def _fast_bar(
+    values: pd.Series,
+    title: str,
+    limit: Optional[int] = None,
+    by_key: bool = False,
+    fill_gaps: bool = False,
+):
+    """
+    Draws a bar chart of the value counts of a series with plain matplotlib.
+
+    Args:
+        values: One entry per occurrence (e.g. one per author of each document).
+        title: Title of the plot.
+        limit: If given, only the most frequent ``limit`` values are drawn.
+        by_key: Order bars by value (e.g. year) instead of by frequency.
+        fill_gaps: For integer values (e.g. years), also draw empty bars for the
+            missing values between the smallest and largest one, like
+            ``litstudy.compute_year_histogram``.
+    """
+    counts = values.value_counts()
+    if limit is not None:
+        counts = counts.head(limit)
+    if by_key:
+        counts = counts.sort_index()
+    if fill_gaps and len(counts):
+        counts = counts.reindex(range(counts.index.min(), counts.index.max() + 1), fill_value=0)
+
+    return _bar_plot(counts, title)
+
+
+@plotting_style()
 def analyze_stats_plots(docs: litstudy.DocumentSet, save: bool, output_dir: pathlib.Path):
-    """Generates general statistical plots."""
+    """
+    Generates general statistical plots.
+
+    As in litstudy, affiliation and publication source names are merged with a
+    ``FuzzyMatcher``, so variants differing only in case, punctuation or stopwords
+    are counted as one.
+    """
+    import pandas as pd
+    from litstudy.common import FuzzyMatcher
+
+    affiliations = FuzzyMatcher()
+    sources = FuzzyMatcher()
+
     plot_ops = [
-        (litstudy.plot_year_histogram, {}, "year_histogram.png"),
         (
-            litstudy.plot_affiliation_histogram,
+            lambda d: [d.publication_year],
+            "Year of publications",
+            {"by_key": True, "fill_gaps": True},
+            "year_histogram.png",
+        ),
+        (
+            lambda d: {affiliations.get(name) for name in _affiliation_names(d)},
+            "Affiliations",
             {"limit": PLOT_LIMIT_BARS},
             "affiliation_histogram.png",
         ),
         (
-            litstudy.plot_author_histogram,
+            lambda d: [a.name for a in d.authors or []],
+            "Authors",
             {"limit": PLOT_LIMIT_BARS},
             "author_histogram.png",
-        ),  # Added limit
-        (litstudy.plot_language_histogram, {}, "language_histogram.png"),
-        (litstudy.plot_country_histogram, {"limit": PLOT_LIMIT_BARS}, "country_histogram.png"),
-        (litstudy.plot_source_histogram, {"limit": PLOT_LIMIT_BARS}, "source_histogram.png"),
+        ),
+        (lambda d: [d.language] if d.language else [], "Language", {}, "language_histogram.png"),
+        (_countries, "Countries", {"limit": PLOT_LIMIT_BARS}, "country_histogram.png"),
+        (
+            lambda d: [sources.get(d.publication_source) if d.publication_source else "(unknown)"],
+            "Publication source",
+            {"limit": PLOT_LIMIT_BARS},
+            "source_histogram.png",
+        ),
     ]
 
-    for func, kwargs, fname in plot_ops:
+    for extract, title, kwargs, fname in plot_ops:
         try:
             logger.info(f"Generating {fname}...")
-            func(docs, **kwargs)
-            save_or_show_plot(save, fname, output_dir)
+            values = pd.Series([v for doc in docs for v in extract(doc) if v is not None])
+            fig = _fast_bar(values, title, **kwargs)
+            save_or_show_plot(save, fname, output_dir, fig)
         except Exception as e:
             logger.error(f"Could not generate {fname}: {e}")
 
 
-def analyze_network(docs: litstudy.DocumentSet, save: bool, output_dir: pathlib.Path):
-    """Generates citation network plot."""
+def build_cocitation_network(docs: litstudy.DocumentSet, max_edges: int) -> nx.Graph:
+    """
+    Builds the same co-citation network as ``litstudy.network.build_cocitation_network``
+    using sparse matrices.
+
+    The citations between documents in the set form a sparse ``citing x cited``
+    matrix ``M``; ``M.T @ M`` then holds the number of documents citing each pair
+    together. Only the ``max_edges`` strongest pairs are selected (with
+    ``np.argpartition``) and added to the graph, so no pairwise table is built in
+    Python.
+
+    Args:
+        docs: Documents to include as nodes.
+        max_edges: Maximum number of (strongest) edges to keep.
+
+    Returns:
+        nx.Graph: Undirected graph whose edge weights are co-citation counts.
+    """
+    import litstudy
+    import numpy as np
+    from scipy import sparse
+
+    g, mapping = litstudy.network.build_base_network(docs, False)
+    citing, cited = [], []
+
+    for i, doc in enumerate(docs):
+        for ref in doc.references or []:
+            j = mapping.get(ref)
+            if j is not None:
+                citing.append(i)
+                cited.append(j)
+
+    n = len(docs)
+    ones = np.ones(len(citing), dtype=np.int32)
+    citations = sparse.csr_matrix((ones, (citing, cited)), shape=(n, n))
+    citations.data[:] = 1  # A reference listed twice still counts once
+
+    strength = sparse.triu(citations.T @ citations, k=1).tocoo()
+    rows, cols, weights = strength.row, strength.col, strength.data
+
+    if len(weights) > max_edges:
+        top = np.argpartition(-weights, max_edges)[:max_edges]
+        rows, cols, weights = rows[top], cols[top], weights[top]
+
+    g.add_weighted_edges_from(zip(rows.tolist(), cols.tolist(), weights.tolist()))
+    return g
+
+
+def _docs_fingerprint(docs: litstudy.DocumentSet) -> str:
+    """Returns a short hash of the document identifiers and the references they cite."""
+    h = hashlib.sha1()
+    for doc in docs:
+        refs = sorted(ref.doi or (ref.title or "").lower() for ref in doc.references or [])
+        h.update(f"{_doc_key(doc)}:{'|'.join(refs)};".encode())
+    return h.hexdigest()[:12]
+
+
+def use_gpu_networkx_backend():
+    """
+    Prefers the ``nx-cugraph`` GPU backend for networkx algorithms if it is installed.
+
+    networkx reads these variables when it is first imported, so this must run
+    before anything imports networkx (including litstudy). Without nx-cugraph
+    (e.g. no NVIDIA GPU) the default backend is used.
+    """
+    if importlib.util.find_spec("nx_cugraph") is None:
+        return
+
+    os.environ.setdefault("NETWORKX_BACKEND_PRIORITY", "cugraph")
+    os.environ.setdefault("NETWORKX_CACHE_CONVERTED_GRAPHS", "True")
+    logger.info("Using the nx-cugraph backend for networkx algorithms.")
+
+
+def _network_layout(net: nx.Graph) -> dict:
+    """Computes node positions for the largest connected component, as drawn by litstudy."""
+    import networkx as nx
+
+    if net.number_of_edges() == 0:
+        return {}
+
+    component = max(nx.connected_components(net), key=len)
+    return nx.spring_layout(net.subgraph(component), seed=0)
+
+
+def _plot_network(net: nx.Graph, pos: dict):
+    """
+    Plots the network with ``litstudy.network.plot_network`` using precomputed positions.
+
+    ``plot_network`` has no layout parameter and recomputes the layout on every call,
+    so its ``calculate_layout`` hook is replaced while plotting. It falls back to the
+    original when ``pos`` does not cover the nodes being drawn.
+    """
+    import litstudy
+
+    calculate_layout = litstudy.network.calculate_layout
+
+    def cached_layout(g, **kwargs):
+        return pos if pos and all(n in pos for n in g) else calculate_layout(g, **kwargs)
+
+    litstudy.network.calculate_layout = cached_layout
     try:
-        logger.info("Building co-citation network...")
-        net = litstudy.network.build_cocitation_network(docs, max_edges=MAX_NETWORK_EDGES)
-        litstudy.network.plot_network(net)
+        return litstudy.network.plot_network(net)
+    finally:
+        litstudy.network.calculate_layout = calculate_layout
+
+
+@plotting_style()
+def analyze_network(
+    docs: litstudy.DocumentSet,
+    save: bool,
+    output_dir: pathlib.Path,
+    cache_dir: Optional[pathlib.Path] = None,
+):
+    """
+    Generates citation network plot.
+
+    If ``cache_dir`` is given, the network and its layout (stored as the ``pos`` node
+    attribute) are cached in ``cache_dir/cocitation_network.pkl`` and reused while the
+    documents (and their references) are unchanged. The file holds a single network
+    and is overwritten when the documents change.
+    """
+    import networkx as nx
+
+    try:
+        key = f"{_docs_fingerprint(docs)}-{MAX_NETWORK_EDGES}"
+        cache_path = cache_dir / NETWORK_CACHE_FILE if cache_dir else None
+        cached = _load_pickle(cache_path, default={})
+
+        if cached.get("key") == key:
+            net = cached["graph"]
+            logger.info(f"Loaded cached co-citation network from {cache_path}")
+        else:
+            logger.info("Building co-citation network...")
+            net = build_cocitation_network(docs, max_edges=MAX_NETWORK_EDGES)
+            nx.set_node_attributes(net, _network_layout(net), "pos")
+            if cache_path:
+                _save_pickle({"key": key, "graph": net}, cache_path)
+
+        _plot_network(net, nx.get_node_attributes(net, "pos"))
         save_or_show_plot(save, "cocitation_network.png", output_dir)
     except Exception as e:
         logger.error(f"Network analysis failed: {e}")
 
 
+@dataclass
+class GroupHistograms:
+    """Year and publication source histograms of a document set split into groups."""
+
+    year: pd.DataFrame
+    source: pd.DataFrame
+
+
+def compute_group_histograms(
+    docs: litstudy.DocumentSet, groups: Union[dict, pd.DataFrame], source_limit: int = 25
+) -> GroupHistograms:
+    """
+    Computes the grouped year and source histograms in one place.
+
+    The tables are plotted directly and kept around for further analysis, so the
+    document list is only aggregated once per histogram.
+
+    Args:
+        docs: Documents to aggregate.
+        groups: Group name to ``DocumentSet.data`` expression mapping, or a
+            DataFrame with one boolean column per group.
+        source_limit: Number of most common publication sources to keep.
+    """
+    import litstudy
+
+    return GroupHistograms(
+        year=litstudy.compute_year_histogram(docs, groups=groups),
+        source=litstudy.compute_source_histogram(docs, groups=groups, limit=source_limit),
+    )
+
+
+def compute_ratio_table(table: pd.DataFrame, group: str) -> pd.DataFrame:
+    """
+    Adds ``total`` and ``ratio`` (share of ``group``) columns to a grouped histogram.
+
+    Args:
+        table: Grouped histogram with one count column per group, e.g.
+            ``GroupHistograms.source``.
+        group: Column whose share of the total is computed.
+
+    Returns:
+        pd.DataFrame: A copy of ``table`` sorted by decreasing ratio. Rows without
+        documents have a NaN ratio and are sorted last.
+    """
+    total = table.sum(axis=1)
+    return table.assign(total=total, ratio=table[group] / total.where(total > 0)).sort_values(
+        by="ratio", ascending=False
+    )
+
+
+@plotting_style()
 def analyze_topics(
-    docs: litstudy.DocumentSet, topic_keyword: str, save: bool, output_dir: pathlib.Path
+    docs: litstudy.DocumentSet,
+    topic_keyword: str,
+    save: bool,
+    output_dir: pathlib.Path,
+    use_minibatch: bool = True,
+    cache_dir: Optional[pathlib.Path] = None,
 ) -> litstudy.DocumentSet:
-    """Performs topic modeling and visualizations."""
+    """
+    Performs topic modeling and visualizations.
+
+    The NMF model is trained with ``train_nmf`` (cached in ``cache_dir``, if given),
+    using ``MiniBatchNMF`` if ``use_minibatch`` is True and the full-batch solver
+    otherwise.
+    """
+    import litstudy
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     try:
         logger.info("Building corpus and computing word distribution...")
         corpus = litstudy.build_corpus(docs)
 
-        litstudy.plot_word_distribution(
-            corpus, limit=50, title="Top words", vertical=True, label_rotation=45
-        )
-        save_or_show_plot(save, "word_distribution.png", output_dir)
+        words = litstudy.compute_word_distribution(corpus, limit=50)["count"]
+        fig = _bar_plot(words / len(corpus.frequencies) * 100, "Top words", ylabel="% of documents")
+        save_or_show_plot(save, "word_distribution.png", output_dir, fig)
 
         logger.info(f"Training NMF Model ({NUM_TOPICS} topics)...")
-        topic_model = litstudy.train_nmf_model(corpus, NUM_TOPICS, max_iter=NMF_MAX_ITER)
+        topic_model = train_nmf(
+            docs, corpus, NUM_TOPICS, cache_dir=cache_dir, minibatch=use_minibatch
+        )
+        topic_model = cache_topic_lookups(topic_model)
 
-        litstudy.plot_topic_clouds(topic_model, ncols=5)
-        save_or_show_plot(save, "topic_clouds.png", output_dir)
+        fig = plt.figure()
+        litstudy.plot_topic_clouds(topic_model, fig=fig, ncols=5)
+        save_or_show_plot(save, "topic_clouds.png", output_dir, fig)
 
-        litstudy.plot_embedding(corpus, topic_model)
-        save_or_show_plot(save, "topic_embedding.png", output_dir)
+        fig, ax = plt.subplots()
+        litstudy.plot_embedding(corpus, topic_model, ax=ax)
+        save_or_show_plot(save, "topic_embedding.png", output_dir, fig)
 
         # Identify best topic
-        topic_id = topic_model.best_topic_for_token(topic_keyword)
-        if topic_id is None:
+        try:
+            topic_id = topic_model.best_topic_for_token(topic_keyword)
+            logger.info(f"Topic #{topic_id} selected for keyword '{topic_keyword}'")
+        except KeyError:
             # Fallback if keyword not found
             logger.warning(f"Keyword '{topic_keyword}' not found in corpus. Using Topic 0.")
             topic_id = 0
-        else:
-            logger.info(f"Topic #{topic_id} selected for keyword '{topic_keyword}'")
 
-        # Mark documents
-        threshold = 0.2
-        is_topic = topic_model.doc2topic[:, topic_id] > threshold
+        # Mark documents (one vectorized comparison; add_property assigns the column at once)
+        is_topic = topic_model.doc2topic[:, topic_id] > TOPIC_THRESHOLD
         docs = docs.add_property("is_relevant_topic", is_topic)
 
-        # Comparative plots
-        groups = {"Relevant": "is_relevant_topic", "Other": "not is_relevant_topic"}
+        # Comparative plots; the mask is used directly instead of evaluating
+        # "is_relevant_topic" / "not is_relevant_topic" against docs.data
+        groups = pd.DataFrame({"Relevant": is_topic, "Other": ~is_topic})
+
+        histograms = compute_group_histograms(docs, groups)
 
-        litstudy.plot_year_histogram(docs, groups=groups, stacked=True)
-        save_or_show_plot(save, "year_histogram_by_relevance.png", output_dir)
+        fig, ax = plt.subplots()
+        litstudy.plot.plot_histogram(
+            histograms.year, title="Year of publications", stacked=True, ax=ax
+        )
+        save_or_show_plot(save, "year_histogram_by_relevance.png", output_dir, fig)
+
+        fig, ax = plt.subplots()
+        litstudy.plot.plot_histogram(
+            histograms.source, title="Publication source", stacked=True, ax=ax
+        )
+        save_or_show_plot(save, "source_histogram_by_relevance.png", output_dir, fig)
 
-        litstudy.plot_source_histogram(docs, groups=groups, limit=25, stacked=True)
-        save_or_show_plot(save, "source_histogram_by_relevance.png", output_dir)
+        # Share of relevant documents, reusing the tables computed for the plots above
+        for name, table in (("year", histograms.year), ("source", histograms.source)):
+            ratios = compute_ratio_table(table, "Relevant")
+            if save:
+                ratios.to_csv(output_dir / f"{name}_relevance_ratio.csv")
+            else:
+                logger.info(
+                    f"Share of relevant documents per {name}:\n{ratios.head(PLOT_LIMIT_BARS)}"
+                )
 
         return docs
 
@@ -282,7 +1179,7 @@ def analyze_topics(
 
 def main():
     args = parse_arguments()
-    setup_plotting_style()
+    use_gpu_networkx_backend()
 
     # Resolve Paths
     base_dir = pathlib.Path(__file__).parent.resolve()
@@ -291,6 +1188,7 @@ def main():
 
     # Output dir: relative to current CWD if simple name, or absolute
     output_dir = pathlib.Path(args.output_dir)
+    cache_dir = pathlib.Path(args.cache_dir)
     if args.save_plots:
         output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Plots will be saved to: {output_dir.resolve()}")
@@ -298,11 +1196,17 @@ def main():
     # --- Pipeline ---
     docs = load_data(data_dir)
     docs = filter_data(docs, data_dir)
-    docs = refine_with_scopus(docs)
+    docs = refine_with_scopus(docs, cache_dir=cache_dir)
 
     analyze_stats_plots(docs, args.save_plots, output_dir)
-    analyze_network(docs, args.save_plots, output_dir)
-    docs = analyze_topics(docs, args.topic_keyword, args.save_plots, output_dir)
+    analyze_network(docs, args.save_plots, output_dir, cache_dir=cache_dir)
+    docs = analyze_topics(
+        docs,
+        args.topic_keyword,
+        args.save_plots,
+        output_dir,
+        cache_dir=cache_dir,
+    )
 
     logger.info("Analysis completed successfully.")
 
@@ -1,12 +1,95 @@
+import csv
+import random
+import subprocess
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+import litstudy
+import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import MiniBatchNMF
 
 # Add project root to path to ensure modules are found
 sys.path.append(str(Path(__file__).parent.parent))
 
 from analysis import bibliography
 
+TOPIC_WORDS = [
+    ["travel", "tourism", "hotel", "flight", "booking", "destination"],
+    ["network", "graph", "neural", "learning", "training", "inference"],
+    ["energy", "battery", "solar", "grid", "power", "turbine"],
+]
+
+BIBTEX_SAMPLE = r"""% a leading comment line
+@comment{ignore {this} block}
+% @article{excluded, title = {Commented out}}
+@string{jnl = "Journal of {Nested} Things"}
+@preamble{"\newcommand{\foo}{bar}"}
+
+@article{first,
+  title = {The {GPU} Era: caf\'e},
+  author = "Doe, Jane and M{\"u}ller, Hans",
+  journal = jnl,
+  month = mar,
+  year = 2021,
+  note = "part " # jnl # {!},
+  doi = {10.1000/abc.1}
+}
+
+@inproceedings(second,
+  title = "A ``quoted'' {T}itle",
+  booktitle = {Proc. of Stuff},
+  year = {1999},
+)
+
+@misc{notitle, year = 2000, year = 2001} % @misc{trailing, title = {Comment}}
+"""
+
+BIBTEX_MULTILINE_SAMPLE = """@comment(a (parenthesised) comment with an unbalanced { brace)
+@preamble("\\newcommand{\\bar}{(baz)}")
+@article(multi,
+  title = {A multi
+           line title},
+  abstract = "Two
+     lines   with   spaces
+\ttabbed",
+  note = {  padded  } # " and
+      more",
+  year = 2020
+)
+@misc{plain, title = {Plain}}
+"""
+
+
+def make_ieee_csv(path, num_docs=40, seed=0):
+    """Writes a synthetic IEEE Xplore export with random titles and abstracts."""
+    rng = random.Random(seed)
+    fields = ["Document Title", "Authors", "Author Affiliations", "Publication Title"]
+    fields += ["Publication Year", "Abstract", "DOI", "Publisher"]
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for i in range(num_docs):
+            words = TOPIC_WORDS[i % len(TOPIC_WORDS)]
+            writer.writerow(
+                {
+                    "Document Title": f"Paper {i} on " + " ".join(rng.sample(words, 3)),
+                    "Authors": f"Author {i % 7}",
+                    "Author Affiliations": f"University {i % 3}",
+                    "Publication Title": f"Journal {i % 4}",
+                    "Publication Year": str(2015 + i % 8),
+                    "Abstract": " ".join(rng.choices(words, k=30)),
+                    "DOI": f"10.1000/test.{i:04d}",
+                    "Publisher": "IEEE",
+                }
+            )
+
 
 class TestBibliographyAnalysis(unittest.TestCase):
     def test_argument_parser(self):
@@ -17,8 +100,25 @@ class TestBibliographyAnalysis(unittest.TestCase):
         self.assertIsNone(args.data_dir)
         self.assertFalse(args.save_plots)
         self.assertEqual(args.output_dir, "results")
+        self.assertEqual(args.cache_dir, ".cache")
         self.assertEqual(args.topic_keyword, "travel")
 
+    def test_import_is_lazy(self):
+        """Importing the module and picking the networkx backend load no heavy libraries."""
+        heavy = "{'litstudy', 'matplotlib', 'sklearn'}"
+        code = (
+            "import sys, analysis.bibliography as b; b.use_gpu_networkx_backend(); "
+            f"print(sorted({heavy} & set(sys.modules)))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(bibliography.__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(out.stdout.strip(), "[]")
+
     def test_paths_exist(self):
         """Test that critical script paths are resolved correctly relative to the file."""
         base_dir = Path(bibliography.__file__).parent.resolve()
@@ -26,5 +126,408 @@ class TestBibliographyAnalysis(unittest.TestCase):
         self.assertTrue((base_dir / "data").exists())
 
 
+class CitingDocument(litstudy.Document):
+    """Minimal document with a title and a list of referenced titles."""
+
+    def __init__(self, title, references=()):
+        super().__init__(litstudy.DocumentIdentifier(title))
+        self._title = title
+        self._refs = [litstudy.DocumentIdentifier(t) for t in references]
+
+    @property
+    def title(self):
+        return self._title
+
+    @property
+    def authors(self):
+        return None
+
+    @property
+    def references(self):
+        return self._refs
+
+
+def make_citing_docs(num_docs=30, seed=0):
+    """Builds a DocumentSet where documents cite random other documents of the set."""
+    rng = random.Random(seed)
+    titles = [f"Study number {chr(65 + i // 26)}{chr(65 + i % 26)}x" for i in range(num_docs)]
+    docs = [CitingDocument(t, rng.sample(titles, 6)) for t in titles]
+    return litstudy.DocumentSet(docs)
+
+
+class TestLoading(unittest.TestCase):
+    def test_fast_bibtex_matches_litstudy(self):
+        """load_bibtex_fast yields the same entries as litstudy.load_bibtex."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "refs.bib")
+            Path(path).write_text(BIBTEX_SAMPLE)
+            fast = bibliography.load_bibtex_fast(path)
+            expected = litstudy.load_bibtex(path)
+
+        # Parsed without falling back to litstudy; the title-less entry is dropped later
+        self.assertEqual(len(bibliography.parse_bibtex(BIBTEX_SAMPLE)), 3)
+        self.assertEqual(len(fast), 2)
+        self.assertEqual([d.entry for d in fast], [d.entry for d in expected])
+
+    def test_parse_bibtex_matches_bibtexparser(self):
+        """Multi-line values and parenthesised blocks are parsed like bibtexparser."""
+        import bibtexparser
+
+        for source in (BIBTEX_SAMPLE, BIBTEX_MULTILINE_SAMPLE):
+            parser = bibtexparser.bparser.BibTexParser(common_strings=True)
+            expected = bibtexparser.loads(source, parser=parser).entries
+            self.assertEqual(bibliography.parse_bibtex(source), expected)
+
+    @unittest.skipUnless(bibliography.HAS_PYARROW, "pyarrow is not installed")
+    def test_fast_csv_matches_litstudy(self):
+        """load_ieee_csv_fast yields the same documents as litstudy.load_ieee_csv."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "ieee.csv")
+            make_ieee_csv(path, num_docs=10)
+            fast = bibliography.load_ieee_csv_fast(path)
+            expected = litstudy.load_ieee_csv(path)
+
+        self.assertEqual([dict(d.entry) for d in fast], [d.entry for d in expected])
+        self.assertEqual([d.id.doi for d in fast], [d.id.doi for d in expected])
+        self.assertEqual([a.name for a in fast[0].authors], [a.name for a in expected[0].authors])
+
+    def test_merge_document_sets_drops_duplicates(self):
+        """Documents sharing a DOI or title are merged once; the first one wins."""
+        with tempfile.TemporaryDirectory() as tmp:
+            make_ieee_csv(Path(tmp) / "a.csv", num_docs=10, seed=0)
+            make_ieee_csv(Path(tmp) / "b.csv", num_docs=15, seed=0)
+            a = litstudy.load_ieee_csv(str(Path(tmp) / "a.csv"))
+            b = litstudy.load_ieee_csv(str(Path(tmp) / "b.csv"))
+
+        merged = bibliography.merge_document_sets([a, b])
+        self.assertEqual(len(merged), 15)
+        self.assertEqual(len(merged.data), 15)
+        self.assertIs(merged.docs[0], a.docs[0])
+
+    def test_merge_document_sets_matches_titles_like_union(self):
+        """Titles differing only in case, punctuation or braces are merged, as by ``|``."""
+        from litstudy.sources.bibtex import BibDocument
+
+        def bib(key, title, **fields):
+            return litstudy.DocumentSet([BibDocument({"ID": key, "title": title, **fields})])
+
+        a = bib("a", "Deep learning for travel - a survey")
+        b = bib("b", "Deep {Learning} for Travel: a Survey")
+        c = bib("c", "{Deep} Learning for Travel", doi="10.1000/c")
+        d = bib("d", "Deep learning for travel", doi="10.1000/d")
+
+        self.assertEqual(len(bibliography.merge_document_sets([a, b])), len(a | b))
+        self.assertEqual(len(bibliography.merge_document_sets([a, b])), 1)
+        self.assertEqual(len(bibliography.merge_document_sets([c, d])), len(c | d))
+        self.assertEqual(len(bibliography.merge_document_sets([c, d])), 2)
+
+
+class TestPlots(unittest.TestCase):
+    def test_fast_bar_limits_and_orders(self):
+        """Bars show the most frequent values; by_key orders them by value."""
+        values = pd.Series([2020, 2021, 2021, 2019, 2021, 2020])
+        fig = bibliography._fast_bar(values, "Years", limit=2, by_key=True)
+        ax = fig.axes[0]
+
+        labels = [t.get_text() for t in ax.get_xticklabels()]
+        self.assertEqual(labels, ["2020", "2021"])
+        self.assertEqual([p.get_height() for p in ax.patches], [2, 3])
+        plt.close(fig)
+
+    def test_fast_bar_fills_gap_years(self):
+        """Years without publications are drawn as empty bars."""
+        values = pd.Series([2018, 2018, 2021])
+        fig = bibliography._fast_bar(values, "Years", by_key=True, fill_gaps=True)
+        ax = fig.axes[0]
+
+        labels = [t.get_text() for t in ax.get_xticklabels()]
+        self.assertEqual(labels, ["2018", "2019", "2020", "2021"])
+        self.assertEqual([p.get_height() for p in ax.patches], [2, 0, 0, 1])
+        plt.close(fig)
+
+    def test_stats_plots_merge_name_variants(self):
+        """Affiliations and sources are counted like litstudy, merging name variants."""
+        counts = {}
+
+        def fake_bar(values, title, **kwargs):
+            counts[title] = values.value_counts().to_dict()
+            return plt.figure()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ieee.csv"
+            make_ieee_csv(path)
+            text = path.read_text().replace("University 1", "the university 0.")
+            path.write_text(text.replace("Journal 1", "journal  0!"))
+            docs = litstudy.load_ieee_csv(str(path))
+
+            with mock.patch.object(bibliography, "_fast_bar", side_effect=fake_bar):
+                bibliography.analyze_stats_plots(docs, True, Path(tmp))
+
+        for title, histogram in (
+            ("Affiliations", litstudy.compute_affiliation_histogram(docs)),
+            ("Publication source", litstudy.compute_source_histogram(docs)),
+        ):
+            self.assertEqual(counts[title], histogram["Frequency"].to_dict())
+
+    def test_plotting_style_is_local(self):
+        """The plotting style only applies inside the context."""
+        before = dict(plt.rcParams)
+        with bibliography.plotting_style():
+            self.assertEqual(tuple(plt.rcParams["figure.figsize"]), bibliography.FIG_SIZE)
+            self.assertEqual(plt.rcParams["savefig.dpi"], bibliography.DPI_SAVING)
+        self.assertEqual(dict(plt.rcParams), before)
+
+
+class TestNetwork(unittest.TestCase):
+    def test_sparse_cocitation_matches_litstudy(self):
+        """The sparse builder yields the same weighted edges as litstudy."""
+        docs = make_citing_docs()
+        expected = litstudy.network.build_cocitation_network(docs, max_edges=10**6)
+        actual = bibliography.build_cocitation_network(docs, max_edges=10**6)
+
+        def edges(g):
+            return {(min(u, v), max(u, v), w) for u, v, w in g.edges(data="weight")}
+
+        self.assertEqual(edges(actual), edges(expected))
+        self.assertEqual(actual.number_of_nodes(), len(docs))
+
+    def test_sparse_cocitation_keeps_strongest_edges(self):
+        """Only the max_edges strongest co-citations are kept."""
+        docs = make_citing_docs()
+        full = bibliography.build_cocitation_network(docs, max_edges=10**6)
+        top = bibliography.build_cocitation_network(docs, max_edges=5)
+
+        weights = sorted((w for _, _, w in full.edges(data="weight")), reverse=True)
+        self.assertEqual(top.number_of_edges(), 5)
+        self.assertEqual(
+            sorted((w for _, _, w in top.edges(data="weight")), reverse=True), weights[:5]
+        )
+
+    def test_network_plot_uses_plotting_style(self):
+        """The co-citation network is drawn with the plotting style active."""
+        styles = []
+
+        def fake_plot(g):
+            styles.append((tuple(plt.rcParams["figure.figsize"]), plt.rcParams["savefig.dpi"]))
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            litstudy.network, "plot_network", side_effect=fake_plot
+        ):
+            bibliography.analyze_network(make_citing_docs(), True, Path(tmp))
+
+        self.assertEqual(styles, [(bibliography.FIG_SIZE, bibliography.DPI_SAVING)])
+
+    def test_network_is_cached(self):
+        """A second analyze_network run loads the pickled graph instead of rebuilding it."""
+        docs = make_citing_docs()
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            litstudy.network, "plot_network"
+        ) as plot, mock.patch.object(
+            bibliography, "build_cocitation_network", wraps=bibliography.build_cocitation_network
+        ) as build:
+            bibliography.analyze_network(docs, True, Path(tmp), cache_dir=Path(tmp))
+            bibliography.analyze_network(docs, True, Path(tmp), cache_dir=Path(tmp))
+            # A different corpus replaces the cached network instead of adding a file
+            bibliography.analyze_network(make_citing_docs(seed=1), True, Path(tmp), Path(tmp))
+            cache_files = [p.name for p in Path(tmp).glob("*.pkl")]
+
+        self.assertEqual(build.call_count, 2)
+        first, second, _ = (call.args[0] for call in plot.call_args_list)
+        self.assertEqual(set(first.edges), set(second.edges))
+        self.assertEqual(cache_files, [bibliography.NETWORK_CACHE_FILE])
+
+    def test_network_layout_is_cached(self):
+        """The layout is computed once, stored with the graph and handed to litstudy."""
+        docs = make_citing_docs()
+        layouts = []
+
+        def fake_plot(g):
+            # Like litstudy, lay out the largest connected component only
+            component = g.subgraph(max(nx.connected_components(g), key=len))
+            layouts.append(litstudy.network.calculate_layout(component))
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(
+            litstudy.network, "plot_network", side_effect=fake_plot
+        ), mock.patch.object(litstudy.network, "calculate_layout") as default_layout, mock.patch(
+            "networkx.spring_layout", wraps=nx.spring_layout
+        ) as layout:
+            bibliography.analyze_network(docs, True, Path(tmp), cache_dir=Path(tmp))
+            bibliography.analyze_network(docs, True, Path(tmp), cache_dir=Path(tmp))
+
+        self.assertEqual(layout.call_count, 1)
+        default_layout.assert_not_called()
+        self.assertEqual(len(layouts), 2)
+        self.assertTrue(layouts[0])
+        self.assertEqual(layouts[0].keys(), layouts[1].keys())
+
+
+class TestFilterData(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        make_ieee_csv(self.tmp_dir / "ieee.csv")
+        self.docs = litstudy.load_ieee_csv(str(self.tmp_dir / "ieee.csv"))
+
+        # Excluded by DOI, by title (no DOI), and a title match with a different DOI
+        lines = []
+        for doc, doi in [(self.docs[0], self.docs[0].id.doi), (self.docs[1], None)]:
+            lines += ["TY  - JOUR", f"TI  - {doc.title}"]
+            lines += [f"DO  - {doi}"] if doi else []
+            lines += ["ER  - ", ""]
+        lines += ["TY  - JOUR", f"TI  - {self.docs[2].title}", "DO  - 10.9999/other", "ER  - "]
+        (self.tmp_dir / "exclude.ris").write_text("\n".join(lines) + "\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_matches_litstudy_difference(self):
+        """Hashed exclusion removes the same documents as DocumentSet.__sub__."""
+        excluded = litstudy.load_ris_file(str(self.tmp_dir / "exclude.ris"))
+        expected = [d.title for d in self.docs - excluded]
+
+        filtered = bibliography.filter_data(self.docs, self.tmp_dir)
+        self.assertEqual([d.title for d in filtered], expected)
+        self.assertEqual(len(filtered), len(self.docs) - 2)
+
+    def test_exclusions_are_loaded_once(self):
+        bibliography._load_exclusions.cache_clear()
+        with mock.patch.object(litstudy, "load_ris_file", wraps=litstudy.load_ris_file) as load:
+            bibliography.filter_data(self.docs, self.tmp_dir)
+            bibliography.filter_data(self.docs, self.tmp_dir)
+        load.assert_called_once()
+
+
+class TestScopusCache(unittest.TestCase):
+    def test_refine_with_scopus_uses_cache(self):
+        """Found documents are cached; only misses are sent to the API again."""
+
+        def fake_refine(docs):
+            half = len(docs) // 2
+            return docs.select(list(range(half))), docs.select(list(range(half, len(docs))))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            make_ieee_csv(Path(tmp) / "ieee.csv", num_docs=10)
+            docs = litstudy.load_ieee_csv(str(Path(tmp) / "ieee.csv"))
+
+            with mock.patch.object(litstudy, "refine_scopus", side_effect=fake_refine) as refine:
+                first = bibliography.refine_with_scopus(docs, cache_dir=Path(tmp))
+                second = bibliography.refine_with_scopus(docs, cache_dir=Path(tmp))
+
+        self.assertEqual(refine.call_count, 2)
+        self.assertEqual(len(refine.call_args.args[0]), 5)
+        self.assertEqual(len(first), 5)
+        self.assertEqual(len(second), 7)
+        self.assertEqual([d.title for d in second][:5], [d.title for d in first])
+
+    def test_refine_with_scopus_maps_results_by_position(self):
+        """Documents sharing a cache key each get their own refinement result."""
+        with tempfile.TemporaryDirectory() as tmp:
+            make_ieee_csv(Path(tmp) / "ieee.csv", num_docs=4)
+            docs = litstudy.load_ieee_csv(str(Path(tmp) / "ieee.csv"))
+        with mock.patch.object(bibliography, "_doc_key", return_value="same"):
+            # Only the first document is not found
+            with mock.patch.object(
+                litstudy,
+                "refine_scopus",
+                side_effect=lambda d: (d.select([1, 2, 3]), d.select([0])),
+            ):
+                refined = bibliography.refine_with_scopus(docs)
+
+        self.assertEqual([d.title for d in refined], [d.title for d in docs][1:])
+
+
+class TestTopicModeling(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.tmp_dir = Path(self.tmp.name)
+        make_ieee_csv(self.tmp_dir / "ieee.csv")
+        self.docs = litstudy.load_ieee_csv(str(self.tmp_dir / "ieee.csv"))
+        self.corpus = litstudy.build_corpus(self.docs)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_minibatch_nmf_shape_and_cache(self):
+        """MiniBatchNMF output matches the litstudy TopicModel layout and is cached."""
+        model = bibliography.train_nmf(self.docs, self.corpus, 3, cache_dir=self.tmp_dir)
+        self.assertEqual(model.doc2topic.shape, (len(self.docs), 3))
+        self.assertEqual(model.topic2token.shape, (3, len(self.corpus.dictionary)))
+        self.assertEqual(model.topic2token.dtype, np.float32)
+        self.assertTrue((self.tmp_dir / bibliography.NMF_CACHE_FILE).exists())
+
+        cached = bibliography.train_nmf(self.docs, self.corpus, 3, cache_dir=self.tmp_dir)
+        self.assertTrue((cached.doc2topic == model.doc2topic).all())
+
+        with mock.patch.object(bibliography, "NMF_MAX_ITER", 5), mock.patch(
+            "sklearn.decomposition.MiniBatchNMF", wraps=MiniBatchNMF
+        ) as minibatch:
+            bibliography.train_nmf(self.docs, self.corpus, 3, cache_dir=self.tmp_dir)
+        minibatch.assert_called_once()
+
+    def test_nmf_cache_tracks_word_counts(self):
+        """Documents with the same identifiers but different text are not served from cache."""
+        bibliography.train_nmf(self.docs, self.corpus, 3, cache_dir=self.tmp_dir)
+
+        make_ieee_csv(self.tmp_dir / "changed.csv", seed=1)
+        docs = litstudy.load_ieee_csv(str(self.tmp_dir / "changed.csv"))
+        self.assertEqual([d.id.doi for d in docs], [d.id.doi for d in self.docs])
+        with mock.patch("sklearn.decomposition.MiniBatchNMF", wraps=MiniBatchNMF) as minibatch:
+            bibliography.train_nmf(docs, litstudy.build_corpus(docs), 3, cache_dir=self.tmp_dir)
+        minibatch.assert_called_once()
+
+    def test_full_batch_nmf_has_separate_cache_key(self):
+        """The full-batch solver does not reuse factors cached by MiniBatchNMF."""
+        bibliography.train_nmf(self.docs, self.corpus, 3, cache_dir=self.tmp_dir)
+        with mock.patch("sklearn.decomposition.MiniBatchNMF") as minibatch:
+            model = bibliography.train_nmf(
+                self.docs, self.corpus, 3, cache_dir=self.tmp_dir, minibatch=False
+            )
+        minibatch.assert_not_called()
+        self.assertEqual(model.doc2topic.shape, (len(self.docs), 3))
+        self.assertTrue(np.allclose(model.topic2token.sum(axis=1), 1, atol=1e-5))
+
+    def test_topic_lookups_are_cached(self):
+        model = bibliography.cache_topic_lookups(bibliography.train_nmf(self.docs, self.corpus, 3))
+        token = self.corpus.dictionary[0]
+
+        self.assertEqual(model.best_topic_for_token(token), model.best_topic_for_token(token))
+        self.assertEqual(model.best_topic_for_token.cache_info().hits, 1)
+        with self.assertRaises(KeyError):
+            model.best_topic_for_token("not-a-token")
+
+    def test_unknown_topic_keyword_falls_back_to_first_topic(self):
+        # The embedding needs a larger vocabulary than the synthetic corpus has
+        with mock.patch.object(litstudy, "plot_embedding"):
+            docs = bibliography.analyze_topics(self.docs, "not-a-token", True, self.tmp_dir)
+        self.assertIn("is_relevant_topic", docs.data.columns)
+
+    def test_group_histograms(self):
+        """Grouped histograms have one column per group and count every document."""
+        docs = self.docs.add_property("is_relevant_topic", [i % 2 == 0 for i in range(40)])
+        groups = {"Relevant": "is_relevant_topic", "Other": "not is_relevant_topic"}
+
+        histograms = bibliography.compute_group_histograms(docs, groups)
+        self.assertEqual(list(histograms.year.columns), ["Relevant", "Other"])
+        self.assertEqual(histograms.year.to_numpy().sum(), len(docs))
+        self.assertLessEqual(len(histograms.source), 25)
+
+        mask = np.arange(40) % 2 == 0
+        frame = pd.DataFrame({"Relevant": mask, "Other": ~mask})
+        from_mask = bibliography.compute_group_histograms(self.docs, frame)
+        self.assertTrue(from_mask.year.equals(histograms.year))
+
+    def test_ratio_table(self):
+        """The ratio table adds totals and sorts by the share of the group."""
+        table = pd.DataFrame({"Relevant": [1, 3, 0], "Other": [3, 1, 0]}, index=["a", "b", "c"])
+        ratios = bibliography.compute_ratio_table(table, "Relevant")
+
+        self.assertEqual(list(ratios.index), ["b", "a", "c"])
+        self.assertEqual(list(ratios["total"]), [4, 4, 0])
+        self.assertEqual(list(ratios["ratio"][:2]), [0.75, 0.25])
+        self.assertTrue(np.isnan(ratios["ratio"]["c"]))
+        self.assertNotIn("total", table.columns)
+
+
 if __name__ == "__main__":
     unittest.main()